@@ -1,13 +1,17 @@
 """Defines module exports and interfaces."""
 
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 
 import selenium.webdriver as webdriver
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 
 from league_history_collector.collectors import models
 from league_history_collector.collectors.base import Configuration, ICollector
-from league_history_collector.collectors.nfl import NFLCollector, NFLConfiguration
+from league_history_collector.collectors.nfl import (
+    NFLCollector,
+    NFLCollectorPool,
+    NFLConfiguration,
+)
 from league_history_collector.collectors.sleeper import (
     SleeperCollector,
     SleeperConfiguration,
@@ -26,6 +30,9 @@ def selenium_driver(**kwargs):
     kwargs["desired_capabilities"] = kwargs.get(
         "desired_capabilities", DesiredCapabilities.CHROME
     )
+    # Without keep-alive, every WebDriver command opens a new connection pool and
+    # connection to the server.
+    kwargs["keep_alive"] = kwargs.get("keep_alive", True)
 
     driver = None
     try:
@@ -34,3 +41,13 @@ def selenium_driver(**kwargs):
     finally:
         if driver is not None:
             driver.close()
+
+
+@contextmanager
+def selenium_drivers(count: int, **kwargs):
+    """Yields a list of `count` managed webdriver.Remote resources.
+
+    `kwargs` are passed to `selenium_driver` for each driver."""
+
+    with ExitStack() as stack:
+        yield [stack.enter_context(selenium_driver(**kwargs)) for _ in range(count)]
@@ -2,14 +2,67 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+import copy
 from dataclasses import dataclass
 import json
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, Tuple, Type, TypeVar
 
 from league_history_collector.collectors.models import League
 from league_history_collector.utils import CamelCasedDataclass
 
 
+ConfigurationT = TypeVar("ConfigurationT")
+
+# Loaded configurations, keyed by configuration type and the JSON text they were built
+# from, so repeated loads of the same configuration skip parsing and validation. Callers
+# get copies, so changing a loaded configuration doesn't affect later loads. Entries
+# hold credentials, so only the most recently used few are kept.
+_LOAD_CACHE: OrderedDict[Tuple[type, str], Any] = OrderedDict()
+_LOAD_CACHE_SIZE = 8
+
+
+def read_config_text(
+    filename: Optional[str] = None, dict_config: Optional[dict] = None
+) -> str:
+    """Returns the JSON text of a configuration.
+
+    Exactly one argument must not be None. `filename` is read as is, while
+    `dict_config` is dumped with sorted keys."""
+
+    args = [filename, dict_config]
+    num_not_none = len(args) - args.count(None)
+    if num_not_none != 1:
+        raise ValueError(
+            f"{num_not_none} arguments were not None, expected exactly 1 non-None"
+        )
+
+    if filename is not None:
+        with open(filename) as infile:
+            return infile.read()
+
+    return json.dumps(dict_config, sort_keys=True)
+
+
+def load_cached_config(
+    config_type: Type[ConfigurationT],
+    config_text: str,
+    build: Callable[[dict], ConfigurationT],
+) -> ConfigurationT:
+    """Returns a copy of the configuration built from `config_text`. It is built with
+    `build` only if that JSON text wasn't among the last few loaded as `config_type`."""
+
+    key = (config_type, config_text)
+    if key in _LOAD_CACHE:
+        _LOAD_CACHE.move_to_end(key)
+    else:
+        _LOAD_CACHE[key] = build(json.loads(config_text))
+        if len(_LOAD_CACHE) > _LOAD_CACHE_SIZE:
+            _LOAD_CACHE.popitem(last=False)
+
+    return copy.copy(_LOAD_CACHE[key])
+
+
 @dataclass
 class Configuration(CamelCasedDataclass):
     """Configuration data for a Collector."""
@@ -27,29 +80,9 @@ class Configuration(CamelCasedDataclass):
         be configured with the arguments; for example, `filename` dictates the JSON be
         read from the specified filename."""
 
-        dict_config = Configuration._get_dict_config(
-            filename=filename, dict_config=dict_config
-        )
-
-        return Configuration.from_dict(dict_config)
+        config_text = read_config_text(filename=filename, dict_config=dict_config)
 
-    @staticmethod
-    def _get_dict_config(
-        filename: Optional[str] = None, dict_config: Optional[dict] = None
-    ) -> dict:
-        args = [filename, dict_config]
-        num_not_none = len(args) - args.count(None)
-        if num_not_none != 1:
-            raise ValueError(
-                f"{num_not_none} arguments were not None, expected exactly 1 non-None"
-            )
-
-        if filename is not None:
-            with open(filename) as infile:
-                dict_config = json.load(infile)
-
-        assert dict_config is not None  # pacify static type checker
-        return dict_config
+        return load_cached_config(Configuration, config_text, Configuration.from_dict)
 
 
 class ICollector(ABC):  # pylint: disable=too-few-public-methods
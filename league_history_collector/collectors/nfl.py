@@ -3,17 +3,48 @@
 """For collection league data from NFL Fantasy."""
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+import json
+import os
+from queue import Queue
 import random
+import re
 import time
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urlencode
 
 from loguru import logger
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (
+    InvalidCookieDomainException,
+    NoSuchElementException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-
-from league_history_collector.collectors.base import Configuration, ICollector
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
+
+from league_history_collector.collectors.base import (
+    Configuration,
+    ICollector,
+    load_cached_config,
+    read_config_text,
+)
 from league_history_collector.collectors.models import (
     FinalStanding,
     League,
@@ -32,6 +63,77 @@ from league_history_collector.models import (
 )
 
 
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+# IDs are parsed from many elements per season, so compile the patterns once.
+_TEAM_ID_LINK_RE = re.compile(r"[?&]teamId=(\d+)$")
+_TEAM_ID_CLASS_RE = re.compile(r"(?:^|\s)teamId-(\d+)(?:\s|$)")
+_PLAYER_ID_CLASS_RE = re.compile(r"(?:^|\s)playerNameId-(\d+)(?:\s|$)")
+
+# Reads the text of every season link in the history page's season dropdown, the first
+# `.st-menu` in the season nav, in one WebDriver call. The links are hidden in the
+# dropdown, so `.text` would not work.
+_SEASON_LINK_TEXTS_SCRIPT = (
+    "return Array.from("
+    "document.querySelector('#historySeasonNav .st-menu').querySelectorAll('a'), "
+    "link => link.textContent);"
+)
+
+
+# The same URLs are built repeatedly while collecting a season (e.g. every team's
+# matchup each week), so the builders are memoized. They take the league ID
+# explicitly so the cache isn't keyed on the collector.
+@lru_cache(maxsize=4096)
+def _build_final_standings_url(league_id: str, year: int) -> str:
+    return (
+        f"https://fantasy.nfl.com/league/{league_id}/history/"
+        f"{year}/standings?historyStandingsType=final"
+    )
+
+
+@lru_cache(maxsize=4096)
+def _build_regular_season_standings_url(league_id: str, year: int) -> str:
+    return (
+        f"https://fantasy.nfl.com/league/{league_id}/history/"
+        f"{year}/standings?historyStandingsType=regular"
+    )
+
+
+@lru_cache(maxsize=4096)
+def _build_team_home_url(league_id: str, year: int, team_id: str) -> str:
+    query = urlencode({"teamId": team_id})
+    return f"https://fantasy.nfl.com/league/{league_id}/history/{year}/teamhome?{query}"
+
+
+@lru_cache(maxsize=4096)
+def _build_week_schedule_url(league_id: str, year: int, week: int) -> str:
+    query = urlencode(
+        {
+            "gameSeason": year,
+            "leagueId": league_id,
+            "scheduleDetail": week,
+            "scheduleType": "week",
+            "standingsTab": "schedule",
+        }
+    )
+    return f"https://fantasy.nfl.com/league/{league_id}/history/{year}/schedule?{query}"
+
+
+@lru_cache(maxsize=4096)
+def _build_matchup_url(
+    league_id: str, year: int, week: int, team_id: str, full_box_score: bool = False
+) -> str:
+    params: Dict[str, Any] = {"teamId": team_id, "week": week}
+    if full_box_score is True:
+        params["trackType"] = "fbs"
+
+    return (
+        f"https://fantasy.nfl.com/league/{league_id}/history/"
+        f"{year}/teamgamecenter?{urlencode(params)}"
+    )
+
+
 @dataclass
 class NFLConfiguration(Configuration):
     """Extends the Configuration class with fields specific for NFL Fantasy."""
@@ -44,9 +146,14 @@ class NFLConfiguration(Configuration):
     ) -> NFLConfiguration:
         """Build an NFLConfiguration object from JSON data."""
 
-        dict_config = Configuration._get_dict_config(
-            filename=filename, dict_config=dict_config
+        config_text = read_config_text(filename=filename, dict_config=dict_config)
+
+        return load_cached_config(
+            NFLConfiguration, config_text, NFLConfiguration._from_nested_dict
         )
+
+    @staticmethod
+    def _from_nested_dict(dict_config: dict) -> NFLConfiguration:
         dict_config = {**dict_config, **dict_config["nfl"]}
         del dict_config["nfl"]
 
@@ -61,7 +168,7 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
         config: NFLConfiguration,
         driver: webdriver.Remote,
         time_between_pages_range: Tuple[int, int] = (2, 4),
-        wait_seconds_after_page_change: int = 2,
+        page_load_timeout: int = 10,
     ):
         """Create an NFLCollector.
 
@@ -72,6 +179,8 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
                                   desired_capabilities=DesiredCapabilities.CHROME)`.
             time_between_pages_range: When changing pages, wait for a period of time, in seconds,
                 uniformly randomly selected from within this range (inclusive).
+            page_load_timeout: Maximum time, in seconds, to wait for an element needed from a
+                newly loaded page to appear.
         """
 
         super().__init__()
@@ -80,11 +189,14 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
 
         self._driver = driver
         self._time_between_pages_range = time_between_pages_range
-        self._wait_seconds_after_page_change = wait_seconds_after_page_change
+        self._page_load_timeout = page_load_timeout
 
         # Subtract so first action can occur immediately
         self._last_page_load_time = time.time() - self._time_between_pages_range[1]
 
+        # URL of the page currently loaded by `_load_page`, if any.
+        self._loaded_url: Optional[str] = None
+
         self._logged_in = False
 
     def save_all_data(self) -> League:
@@ -102,6 +214,9 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
         return league
 
     def _change_page(self, action: Callable[..., Any], *args, **kwargs) -> Any:
+        # The action may navigate anywhere, so forget which page is loaded.
+        self._loaded_url = None
+
         interval = random.uniform(
             self._time_between_pages_range[0], self._time_between_pages_range[1]
         )
@@ -109,19 +224,89 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
         time.sleep(max(0, (interval - (time.time() - self._last_page_load_time))))
         self._last_page_load_time = time.time()
 
-        result = action(*args, **kwargs)
+        return action(*args, **kwargs)
 
-        logger.debug(
-            f"Waiting {self._wait_seconds_after_page_change} seconds after page change"
-        )
-        time.sleep(self._wait_seconds_after_page_change)
+    def _load_page(self, url: str, ready_locator: Optional[Tuple[str, str]] = None):
+        """Loads the page at `url`, unless it is already the page `_load_page` last loaded.
+
+        The history pages don't change while collecting, so this saves a page change whenever
+        consecutive steps read the same page, such as the week 1 schedule being used both to
+        list weeks and to get week 1's games.
+
+        If provided, `ready_locator` is a (By, value) locator for the element the caller reads
+        next; after loading, this waits until that element is present rather than for a fixed
+        period of time."""
+
+        if url == self._loaded_url:
+            logger.debug(f"Already on {url}, not reloading")
+            return
 
-        return result
+        self._change_page(self._driver.get, url)
+
+        if ready_locator is not None:
+            logger.debug(f"Waiting for {ready_locator} on {url}")
+            WebDriverWait(self._driver, self._page_load_timeout).until(
+                expected_conditions.presence_of_element_located(ready_locator)
+            )
+
+        # Only skip reloading once the page is known to be ready, and not if the site
+        # redirected elsewhere, e.g. to sign in again.
+        if self._driver.current_url == url:
+            self._loaded_url = url
+        else:
+            logger.debug(f"Loading {url} landed on {self._driver.current_url}")
+
+    def login(self, cookies_file: Optional[str] = None):
+        """Logs in to NFL.com, if not already logged in.
+
+        :param cookies_file: If provided, cookies saved to this file by an earlier login
+            are tried first, and the cookies of a new login are saved to it. The file
+            holds session credentials, so it is only readable and writable by its owner.
+        :type cookies_file: Optional[str]
+        """
+        if self._logged_in:
+            return
+
+        if cookies_file is not None and self._login_from_cookies_file(cookies_file):
+            return
+
+        self._login()
+
+        if cookies_file is not None:
+            file_descriptor = os.open(
+                cookies_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with open(file_descriptor, "w", encoding="utf-8") as outfile:
+                # The mode above only applies when the file is created.
+                os.chmod(cookies_file, 0o600)
+                json.dump(self._driver.get_cookies(), outfile, indent=2, sort_keys=True)
+
+            logger.info(f"Saved session cookies to {cookies_file}")
+
+    def _login_from_cookies_file(self, cookies_file: str) -> bool:
+        if not os.path.isfile(cookies_file):
+            return False
+
+        logger.info(f"Logging in to NFL.com with cookies from {cookies_file}")
+        try:
+            with open(cookies_file, encoding="utf-8") as infile:
+                cookies = json.load(infile)
+
+            self.set_session_cookies(cookies)
+        except RuntimeError:
+            logger.info("Saved cookies are no longer valid, logging in with the form")
+            return False
+        except (KeyError, TypeError, ValueError) as e:
+            # e.g. a file left half-written by an interrupted run.
+            logger.warning(f"Could not use cookies from {cookies_file}: {e!r}")
+            return False
+
+        return True
 
     def _login(self):
         login_url = "https://fantasy.nfl.com/account/sign-in"
         logger.info(f"Logging in to NFL.com at {login_url}")
-        self._change_page(self._driver.get, login_url)
+        self._load_page(login_url, (By.ID, "gigya-login-form"))
 
         login_form = self._driver.find_element_by_id("gigya-login-form")
         username = login_form.find_element_by_id("gigya-loginID-60062076330815260")
@@ -130,6 +315,10 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
         username.send_keys(self._config.username)
         password.send_keys(self._config.password)
 
+        # Loading the sign-in page may have added a query string or otherwise changed
+        # the URL, so the redirect to wait for is away from wherever the form really is.
+        form_url = self._driver.current_url
+
         button_found = False
         input_submit_class_elements = self._driver.find_elements_by_class_name(
             "gigya-input-submit"
@@ -152,21 +341,70 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
             logger.error(msg)
             raise RuntimeError(msg)
 
-        sleep_seconds = 3 - self._wait_seconds_after_page_change
-        if sleep_seconds > 0:
-            logger.debug(
-                f"Sleeping for {sleep_seconds} seconds before checking to make sure we're logged in"
+        logger.debug(
+            "Waiting for redirect before checking to make sure we're logged in"
+        )
+        try:
+            WebDriverWait(self._driver, self._page_load_timeout).until(
+                lambda driver: driver.current_url != form_url
             )
-            time.sleep(sleep_seconds)  # wait for redirect
+        except TimeoutException:
+            # Not being redirected likely means the login failed, which is reported below.
+            logger.warning(f"Still on {form_url} after submitting login form")
+
+        league_url = self._load_league_home()
+
+        logger.success(f"Successfully logged in to {league_url}!")
+        self._logged_in = True
+
+    def _load_league_home(self) -> str:
+        """Loads the league home page, which requires being logged in.
 
+        :return: URL of the league home page.
+        :rtype: str
+        """
         league_url = f"https://fantasy.nfl.com/league/{self._config.league_id}"
-        self._change_page(self._driver.get, league_url)
+        self._load_page(league_url)
         if league_url != self._driver.current_url:
             msg = f"Expected to be on page {league_url}, but on {self._driver.current_url} instead"
             logger.error(msg)
             raise RuntimeError(msg)
 
-        logger.success(f"Successfully logged in to {league_url}!")
+        return league_url
+
+    def get_session_cookies(self) -> List[Dict[str, Any]]:
+        """Gets the cookies of this collector's NFL.com session, logging in if needed.
+
+        The cookies can be passed to `set_session_cookies` of collectors using other
+        drivers, so that only one driver has to log in.
+
+        :return: Cookies of the logged in session, as returned by the driver.
+        :rtype: List[Dict[str, Any]]
+        """
+        if not self._logged_in:
+            self._login()
+
+        return self._driver.get_cookies()
+
+    def set_session_cookies(self, cookies: List[Dict[str, Any]]):
+        """Logs in by adding the cookies of another collector's NFL.com session.
+
+        :param cookies: Cookies returned by another collector's `get_session_cookies`.
+        :type cookies: List[Dict[str, Any]]
+        """
+        # Cookies can only be added for the domain of the page that is currently loaded.
+        self._load_page("https://fantasy.nfl.com")
+        for cookie in cookies:
+            try:
+                self._driver.add_cookie(cookie)
+            except InvalidCookieDomainException:
+                logger.debug(
+                    f"Skipping cookie {cookie.get('name')} for {cookie.get('domain')}"
+                )
+
+        league_url = self._load_league_home()
+
+        logger.success(f"Logged in to {league_url} with shared session cookies")
         self._logged_in = True
 
     def get_seasons(self) -> List[int]:
@@ -181,19 +419,12 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
         league_history_url = (
             f"https://fantasy.nfl.com/league/{self._config.league_id}/history"
         )
-        self._change_page(self._driver.get, league_history_url)
-
-        history_season_nav = self._driver.find_element_by_id("historySeasonNav")
-        seasons_dropdown = history_season_nav.find_element_by_class_name("st-menu")
-        season_list_items = seasons_dropdown.find_elements_by_xpath(".//a")
+        self._load_page(league_history_url, (By.ID, "historySeasonNav"))
 
-        seasons = []
-        for item in season_list_items:
-            # Gets the year which is in the link text. The item is hidden in the dropdown,
-            # so `.text` does not work.
-            seasons.append(int(item.get_attribute("textContent").split(" ")[0]))
+        season_link_texts = self._driver.execute_script(_SEASON_LINK_TEXTS_SCRIPT)
 
-        return seasons
+        # The year is the first word of the link text, e.g. "2019 Season".
+        return [int(text.split(" ")[0]) for text in season_link_texts]
 
     def set_season_data(self, year: int, league: League):
         """Sets data for the specified season in the provided league object.
@@ -243,7 +474,7 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
     ) -> Tuple[Dict[str, List[str]], Dict[str, Manager]]:
         final_standings_url = self._get_final_standings_url(year)
         logger.info(f"Getting managers for {year} from {final_standings_url}")
-        self._change_page(self._driver.get, final_standings_url)
+        self._load_page(final_standings_url, (By.ID, "finalStandings"))
 
         standings_div = self._driver.find_element_by_id("finalStandings")
         results_div = standings_div.find_element_by_class_name("results")
@@ -264,7 +495,7 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
             logger.debug(
                 f"Got team home page for team {team_id} in {year} at {team_home_url}"
             )
-            self._change_page(self._driver.get, team_home_url)
+            self._load_page(team_home_url, (By.ID, "teamDetail"))
 
             team_detail_div = self._driver.find_element_by_id("teamDetail")
             right_side_div = team_detail_div.find_element_by_class_name("owners")
@@ -289,7 +520,7 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
     ) -> Dict[str, FinalStanding]:
         final_standings_url = self._get_final_standings_url(year)
         logger.info(f"Getting final standings for {year} from {final_standings_url}")
-        self._change_page(self._driver.get, final_standings_url)
+        self._load_page(final_standings_url, (By.ID, "finalStandings"))
 
         standings_div = self._driver.find_element_by_id("finalStandings")
         results_div = standings_div.find_element_by_class_name("results")
@@ -328,7 +559,7 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
         logger.info(
             f"Getting regular season standings for {year} from {regular_season_standings_url}"
         )
-        self._change_page(self._driver.get, regular_season_standings_url)
+        self._load_page(regular_season_standings_url, (By.ID, "leagueHistoryStandings"))
 
         standings = self._driver.find_element_by_id("leagueHistoryStandings")
 
@@ -379,7 +610,7 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
     def _get_weeks(self, year: int) -> Set[int]:
         schedule_url = self._get_week_schedule_url(year, 1)
         logger.info(f"Getting weeks in {year} from {schedule_url}")
-        self._change_page(self._driver.get, schedule_url)
+        self._load_page(schedule_url, (By.CLASS_NAME, "scheduleWeekNav"))
 
         schedule_week_nav = self._driver.find_element_by_class_name("scheduleWeekNav")
 
@@ -401,7 +632,7 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
     ) -> Week:
         schedule_url = self._get_week_schedule_url(year, week)
         logger.info(f"Getting games for week {week} in {year} from {schedule_url}")
-        self._change_page(self._driver.get, schedule_url)
+        self._load_page(schedule_url, (By.CLASS_NAME, "scheduleContentWrap"))
 
         schedule_content_div = self._driver.find_element_by_class_name(
             "scheduleContentWrap"
@@ -442,7 +673,7 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
         logger.info(
             f"Getting game results for {year} Week {week} matchup {matchup} from {matchup_url}"
         )
-        self._change_page(self._driver.get, matchup_url)
+        self._load_page(matchup_url, (By.ID, "teamMatchupHeader"))
 
         team_matchup_header = self._driver.find_element_by_id("teamMatchupHeader")
         team_total_divs = team_matchup_header.find_elements_by_class_name("teamTotal")
@@ -492,7 +723,7 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
                 year, week, matchup[0], full_box_score=True
             )
             logger.info(f"Getting full box score from {full_box_score_url}")
-            self._change_page(self._driver.get, full_box_score_url)
+            self._load_page(full_box_score_url, (By.ID, "teamMatchupTrack"))
         else:
             logger.debug("Getting full box score from current page")
 
@@ -565,83 +796,113 @@ class NFLCollector(ICollector):  # pylint: disable=too-few-public-methods
         return rosters
 
     def _get_final_standings_url(self, year: int) -> str:
-        return (
-            f"https://fantasy.nfl.com/league/{self._config.league_id}/history/"
-            f"{year}/standings?historyStandingsType=final"
-        )
+        return _build_final_standings_url(self._config.league_id, year)
 
     def _get_regular_season_standings_url(self, year: int) -> str:
-        return (
-            f"https://fantasy.nfl.com/league/{self._config.league_id}/history/"
-            f"{year}/standings?historyStandingsType=regular"
-        )
+        return _build_regular_season_standings_url(self._config.league_id, year)
 
     def _get_team_home_url(self, year: int, team_id: str) -> str:
-        return (
-            f"https://fantasy.nfl.com/league/{self._config.league_id}/history/"
-            f"{year}/teamhome?teamId={team_id}"
-        )
+        return _build_team_home_url(self._config.league_id, year, team_id)
 
-    def _get_week_schedule_url(self, year: int, week: int):
-        return (
-            f"https://fantasy.nfl.com/league/{self._config.league_id}/history/"
-            f"{year}/schedule?gameSeason={year}&leagueId={self._config.league_id}&"
-            f"scheduleDetail={week}&scheduleType=week&standingsTab=schedule"
-        )
+    def _get_week_schedule_url(self, year: int, week: int) -> str:
+        return _build_week_schedule_url(self._config.league_id, year, week)
 
     def _get_matchup_url(
         self, year: int, week: int, team_id: str, full_box_score: bool = False
     ) -> str:
-        matchup_url = (
-            f"https://fantasy.nfl.com/league/{self._config.league_id}/history/"
-            f"{year}/teamgamecenter?teamId={team_id}&week={week}"
+        return _build_matchup_url(
+            self._config.league_id, year, week, team_id, full_box_score
         )
 
-        if full_box_score is True:
-            matchup_url += "&trackType=fbs"
-
-        return matchup_url
-
     @staticmethod
     def _get_team_id_from_link(link: WebElement) -> str:
         href_attribute = link.get_attribute("href")
-        team_id = href_attribute.split("teamId=")[-1]
-        try:
-            _ = int(team_id)
-        except ValueError as e:
-            logger.error(f"Team ID {team_id} does not seem correct (not an integer)")
+        match = _TEAM_ID_LINK_RE.search(href_attribute)
+        if match is None:
+            logger.error(f"Could not find an integer team ID in {href_attribute}")
             raise RuntimeError(
                 f"Could not get team ID from `href` attribute: {href_attribute}"
-            ) from e
+            )
 
-        return team_id
+        return match.group(1)
 
     @staticmethod
     def _get_team_id_from_class(element: WebElement) -> str:
         class_attribute = element.get_attribute("class")
-        team_id = class_attribute.split("teamId-")[-1]
-        try:
-            _ = int(team_id)
-        except ValueError as e:
-            logger.error(f"Team ID {team_id} does not seem correct (not an integer)")
+        match = _TEAM_ID_CLASS_RE.search(class_attribute)
+        if match is None:
+            logger.error(f"Could not find an integer team ID in {class_attribute}")
             raise RuntimeError(
                 f"Could not get team ID from `class` attribute: {class_attribute}"
-            ) from e
+            )
 
-        return team_id
+        return match.group(1)
 
     @staticmethod
     def _get_player_id_from_class(element: WebElement) -> str:
         class_attribute = element.get_attribute("class")
-        player_id = class_attribute.split("playerNameId-")[-1].split(" ")[0]
-        try:
-            _ = int(player_id)
-        except ValueError as e:
-            logger.error(
-                f"Player ID {player_id} does not seem correct (not an integer)"
-            )
+        match = _PLAYER_ID_CLASS_RE.search(class_attribute)
+        if match is None:
+            logger.error(f"Could not find an integer player ID in {class_attribute}")
             raise RuntimeError(
                 f"Could not get player ID from `class` attribute: {class_attribute}"
-            ) from e
+            )
+
+        return match.group(1)
+
+
+class NFLCollectorPool:
+    """Collectors sharing one NFL.com session, for collecting in parallel.
+
+    Only the first collector logs in; the others reuse its session cookies. Each
+    collector owns a driver, so a borrowed collector is only used by one thread at a
+    time."""
+
+    def __init__(
+        self, collectors: List[NFLCollector], cookies_file: Optional[str] = None
+    ):
+        """Create an NFLCollectorPool, logging in its collectors.
+
+        args:
+            collectors: Collectors to share the session, each with its own driver.
+            cookies_file: Passed to `NFLCollector.login` of the first collector.
+        """
+
+        first_collector, *other_collectors = collectors
+
+        first_collector.login(cookies_file)
+        cookies = first_collector.get_session_cookies()
+
+        self._size = len(collectors)
+        self._collectors: Queue[NFLCollector] = Queue()
+        self._collectors.put(first_collector)
+        for collector in other_collectors:
+            collector.set_session_cookies(cookies)
+            self._collectors.put(collector)
+
+    @contextmanager
+    def borrow(self) -> Iterator[NFLCollector]:
+        """Yields a collector that no other thread is using until the context exits."""
+
+        collector = self._collectors.get()
+        try:
+            yield collector
+        finally:
+            self._collectors.put(collector)
+
+    def map(
+        self, function: Callable[[NFLCollector, ItemT], ResultT], items: Iterable[ItemT]
+    ) -> Iterator[ResultT]:
+        """Calls `function` with a borrowed collector and each item, with one thread per
+        collector.
+
+        :return: Results in the order of `items`, as they become available.
+        :rtype: Iterator[ResultT]
+        """
+
+        def _call(item: ItemT) -> ResultT:
+            with self.borrow() as collector:
+                return function(collector, item)
 
-        return player_id
+        with ThreadPoolExecutor(max_workers=self._size) as executor:
+            yield from executor.map(_call, items)
@@ -7,13 +7,17 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import json
 import os
-from typing import Any, ClassVar, Dict, List, Set, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
 
 from dataclasses_json.api import DataClassJsonMixin
 from loguru import logger
 import requests
 
-from league_history_collector.collectors.base import ICollector
+from league_history_collector.collectors.base import (
+    ICollector,
+    load_cached_config,
+    read_config_text,
+)
 from league_history_collector.collectors.models import (
     Draft,
     FinalStanding,
@@ -35,6 +39,20 @@ class SleeperConfiguration(DataClassJsonMixin):
     league_id: str
     players_file: str
 
+    @staticmethod
+    def load(
+        filename: Optional[str] = None, dict_config: Optional[dict] = None
+    ) -> "SleeperConfiguration":
+        """Build a SleeperConfiguration object from JSON data.
+
+        Arguments are as for `Configuration.load`."""
+
+        config_text = read_config_text(filename=filename, dict_config=dict_config)
+
+        return load_cached_config(
+            SleeperConfiguration, config_text, SleeperConfiguration.from_dict
+        )
+
 
 class SleeperCollector(ICollector):
     """Collector for fantasy football leagues on Sleeper."""
@@ -35,9 +35,8 @@ def set_managers(
                 managers_output[row["manager_id"]] = row["manager_name"]
 
     for m_id, manager in managers.items():
-        managers_output[id_mapper(m_id)] = managers_output.get(
-            id_mapper(m_id), manager.name
-        )
+        mapped_id = id_mapper(m_id)
+        managers_output[mapped_id] = managers_output.get(mapped_id, manager.name)
 
     with open(file_name, "w", encoding="utf-8") as outfile:
         fieldnames = ["manager_id", "manager_name"]
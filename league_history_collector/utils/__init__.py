@@ -1,7 +1,9 @@
 """Utility objects and functions."""
 
+import argparse
 from dataclasses import dataclass
-from typing import ClassVar, Dict
+import json
+from typing import Any, ClassVar, Dict
 
 from dataclasses_json.api import DataClassJsonMixin, LetterCase
 from dataclasses_json.cfg import config as dataclasses_json_config
@@ -25,3 +27,26 @@ class CamelCasedDataclass(DataClassJsonMixin):
     dataclass_json_config: ClassVar[Dict] = dataclasses_json_config(
         letter_case=camelcase
     )["dataclasses_json"]
+
+
+def dump_json(data: Any, pretty: bool = False) -> bytes:
+    """Serializes data to UTF-8 encoded JSON with sorted keys.
+
+    Output is compact unless `pretty` is True, in which case it is indented by two
+    spaces. Keys are sorted before non-string keys, such as the weeks keying
+    `Season.weeks`, are converted to strings, so week 10 sorts after week 2."""
+
+    if pretty:
+        return json.dumps(data, sort_keys=True, indent=2).encode("utf-8")
+
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def positive_int(value: str) -> int:
+    """Parses a positive integer, for use as an argparse argument type."""
+
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+
+    return number
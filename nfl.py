@@ -3,47 +3,70 @@
 """Collects league history for NFL Fantasy."""
 
 import argparse
-import json
 import sys
+from typing import Optional
 
 from loguru import logger
 
 from league_history_collector.collectors import (
     NFLCollector,
+    NFLCollectorPool,
     NFLConfiguration,
-    selenium_driver,
+    selenium_drivers,
 )
 from league_history_collector.collectors.models import League
+from league_history_collector.utils import dump_json, positive_int
 
 
-def run_collector(collector_config: NFLConfiguration):
-    """Runs a collector on the league specified by the provided configuration."""
+def _merge_season(overall_league_data: League, year: int, league: League):
+    overall_league_data.seasons[year] = league.seasons[year]
+    for manager, manager_data in league.managers.items():
+        if manager not in overall_league_data.managers:
+            overall_league_data.managers[manager] = manager_data
+        else:
+            overall_league_data.managers[manager].seasons.append(year)
 
-    with selenium_driver() as driver:
-        collector = NFLCollector(collector_config, driver, (2, 4))
 
-        overall_league_data = League(
-            id=collector_config.league_id, managers={}, seasons={}
+def run_collector(
+    collector_config: NFLConfiguration,
+    num_drivers: int = 1,
+    pretty: bool = False,
+    cookies_file: Optional[str] = None,
+):
+    """Runs a collector on the league specified by the provided configuration.
+
+    Seasons are collected in parallel, with one browser session per driver. Only the
+    first driver logs in; the others reuse its session cookies."""
+
+    with selenium_drivers(num_drivers) as drivers:
+        collectors = NFLCollectorPool(
+            [NFLCollector(collector_config, driver, (2, 4)) for driver in drivers],
+            cookies_file,
         )
 
-        # Getting all the data at once was getting flaky, so let's split it by season.
-        seasons = collector.get_seasons()
-        for year in seasons:
+        def _collect_season(collector: NFLCollector, year: int) -> League:
             league = League(id=collector_config.league_id, managers={}, seasons={})
             collector.set_season_data(year, league)
+            return league
 
-            with open(f"{year}.json", "w") as outfile:
-                json.dump(league.to_dict(), outfile, sort_keys=True, indent=2)
+        with collectors.borrow() as collector:
+            seasons = collector.get_seasons()
 
-            overall_league_data.seasons[year] = league.seasons[year]
-            for manager, manager_data in league.managers.items():
-                if manager not in overall_league_data.managers:
-                    overall_league_data.managers[manager] = manager_data
-                else:
-                    overall_league_data.managers[manager].seasons.append(year)
+        overall_league_data = League(
+            id=collector_config.league_id, managers={}, seasons={}
+        )
 
-        with open("league.json", "w") as outfile:
-            json.dump(overall_league_data.to_dict(), outfile, sort_keys=True, indent=2)
+        # Getting all the data at once was getting flaky, so let's split it by season.
+        # Results are merged in season order, so the output doesn't depend on which season
+        # finishes first.
+        for year, league in zip(seasons, collectors.map(_collect_season, seasons)):
+            with open(f"{year}.json", "wb") as outfile:
+                outfile.write(dump_json(league.to_dict(), pretty=pretty))
+
+            _merge_season(overall_league_data, year, league)
+
+        with open("league.json", "wb") as outfile:
+            outfile.write(dump_json(overall_league_data.to_dict(), pretty=pretty))
 
 
 if __name__ == "__main__":
@@ -54,8 +77,23 @@ if __name__ == "__main__":
     parser.add_argument(
         "-c", "--config", help="Path to configuration file", default="nfl.json"
     )
+    parser.add_argument(
+        "-d",
+        "--drivers",
+        help="Number of browser sessions used to collect seasons in parallel",
+        type=positive_int,
+        default=1,
+    )
+    parser.add_argument(
+        "--pretty", help="Indent the JSON output", action="store_true", default=False
+    )
+    parser.add_argument(
+        "--cookies",
+        help="Path to a file for saving and reusing the logged in session's cookies",
+        default=None,
+    )
 
     args = parser.parse_args()
     config = NFLConfiguration.load(filename=args.config)
 
-    run_collector(config)
+    run_collector(config, args.drivers, args.pretty, args.cookies)
@@ -3,28 +3,50 @@
 """Collects league history for Sleeper."""
 
 import argparse
-import json
+from concurrent.futures import ThreadPoolExecutor
 import sys
+from typing import Any, Dict
 
 from loguru import logger
 
 from league_history_collector.collectors import SleeperConfiguration, SleeperCollector
 from league_history_collector.collectors.models import League
+from league_history_collector.utils import dump_json
 
 
-def run_collector(collector_config: SleeperConfiguration):
+def _write_season(filename: str, season_data: Dict[str, Any], pretty: bool):
+    with open(filename, "wb") as outfile:
+        outfile.write(dump_json(season_data, pretty=pretty))
+
+    logger.info(f"Wrote season data to {filename}")
+
+
+def run_collector(collector_config: SleeperConfiguration, pretty: bool = False):
     """Runs a collector on the league specified by the provided configuration."""
 
     collector = SleeperCollector(collector_config)
     seasons = collector.get_seasons()
 
-    for year in seasons:
-        with open(f"{year}.json", "w") as outfile:
+    # Writing to disk happens on a background thread so the next season can be collected in the
+    # meantime. `to_dict` is called here so the writer never touches the dataclasses.
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        writes = []
+        for year in seasons:
             league = League(id=collector.season_to_id[year], managers={}, seasons={})
             collector.set_season_data(year, league)
 
-            with open(f"{collector_config.league_id}-{year}.json", "w") as outfile:
-                json.dump(league.to_dict(), outfile, sort_keys=True, indent=2)
+            writes.append(
+                writer.submit(
+                    _write_season,
+                    f"{collector_config.league_id}-{year}.json",
+                    league.to_dict(),
+                    pretty,
+                )
+            )
+
+        # Surface any errors raised while writing.
+        for write in writes:
+            write.result()
 
 
 if __name__ == "__main__":
@@ -35,11 +57,11 @@ if __name__ == "__main__":
     parser.add_argument(
         "-c", "--config", help="Path to configuration file", default="sleeper.json"
     )
+    parser.add_argument(
+        "--pretty", help="Indent the JSON output", action="store_true", default=False
+    )
 
     args = parser.parse_args()
-    with open(args.config, encoding="utf-8") as infile:
-        config_dict = json.load(infile)
-
-    config = SleeperConfiguration.from_dict(config_dict)
+    config = SleeperConfiguration.load(filename=args.config)
 
-    run_collector(config)
+    run_collector(config, args.pretty)
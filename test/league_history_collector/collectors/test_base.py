@@ -1,33 +1,106 @@
 # pylint: disable=missing-class-docstring,missing-function-docstring,redefined-outer-name,missing-module-docstring,invalid-name
 
+from collections import OrderedDict
 import json
 import tempfile
+from unittest.mock import MagicMock
 
 import pytest
 
-from league_history_collector.collectors import Configuration
+from league_history_collector.collectors import Configuration, SleeperConfiguration
+from league_history_collector.collectors import base
 
 
-def test_Configuration_load():
-    dict_config = {"username": "nemo", "password": "hunter2"}
+_DICT_CONFIG = {"username": "nemo", "password": "hunter2"}
 
-    expected_config = Configuration.load(dict_config=dict_config)
 
+@pytest.fixture(name="config_filename", scope="module")
+def fixture_config_filename(tmp_path_factory) -> str:
+    # Tests only read the file, so it is written once for the module.
+    config_file = tmp_path_factory.mktemp("config") / "config.json"
+    config_file.write_text(json.dumps(_DICT_CONFIG))
+    return str(config_file)
+
+
+@pytest.fixture(autouse=True)
+def fixture_empty_load_cache(monkeypatch):
+    # Loads are cached for the whole process, so give each test its own cache.
+    monkeypatch.setattr(base, "_LOAD_CACHE", OrderedDict())
+
+
+def test_Configuration_load(config_filename: str):
+    expected_config = Configuration.load(dict_config=_DICT_CONFIG)
+
+    args = {"filename": config_filename, "dict_config": _DICT_CONFIG}
+
+    for arg, arg_value in args.items():
+        assert Configuration.load(**{arg: arg_value}) == expected_config
+
+
+def test_Configuration_load_is_cached(monkeypatch):
+    from_dict = MagicMock(wraps=Configuration.from_dict)
+    monkeypatch.setattr(Configuration, "from_dict", from_dict)
+
+    # Uses its own file, since the test modifies it.
     with tempfile.NamedTemporaryFile("w") as config_file:
-        config_file.write(json.dumps(dict_config))
+        config_file.write(json.dumps(_DICT_CONFIG))
+        config_file.flush()
+
+        first = Configuration.load(filename=config_file.name)
+        assert Configuration.load(filename=config_file.name) == first
+        from_dict.assert_called_once()
+
+        config_file.write(" ")
         config_file.flush()
 
-        args = {"filename": config_file.name, "dict_config": dict_config}
+        assert Configuration.load(filename=config_file.name) == first
+        assert from_dict.call_count == 2
 
-        for arg, arg_value in args.items():
-            assert Configuration.load(**{arg: arg_value}) == expected_config
+    Configuration.load(dict_config=_DICT_CONFIG)
+    Configuration.load(dict_config=dict(reversed(list(_DICT_CONFIG.items()))))
+    assert from_dict.call_count == 3
 
 
-def test_Configuration_load_validates_arguments():
-    dict_config = {"username": "nemo", "password": "hunter2"}
+def test_Configuration_load_cache_is_bounded(monkeypatch):
+    from_dict = MagicMock(wraps=Configuration.from_dict)
+    monkeypatch.setattr(Configuration, "from_dict", from_dict)
+    monkeypatch.setattr(base, "_LOAD_CACHE_SIZE", 2)
 
+    configs = [{**_DICT_CONFIG, "username": f"user{i}"} for i in range(3)]
+    for dict_config in configs:
+        Configuration.load(dict_config=dict_config)
+
+    assert len(base._LOAD_CACHE) == 2  # pylint: disable=protected-access
+
+    Configuration.load(dict_config=configs[2])
+    assert from_dict.call_count == 3
+
+    Configuration.load(dict_config=configs[0])
+    assert from_dict.call_count == 4
+
+
+def test_Configuration_load_returns_copies(config_filename: str):
+    first = Configuration.load(filename=config_filename)
+    first.password = "changed"
+
+    second = Configuration.load(filename=config_filename)
+    assert second is not first
+    assert second.password == _DICT_CONFIG["password"]
+
+
+def test_SleeperConfiguration_load():
+    dict_config = {"league_id": "12345", "players_file": "players.json"}
+
+    config = SleeperConfiguration.load(dict_config=dict_config)
+
+    assert config == SleeperConfiguration.from_dict(dict_config)
+    assert SleeperConfiguration.load(dict_config=dict_config) is not config
+    assert SleeperConfiguration.load(dict_config=dict_config) == config
+
+
+def test_Configuration_load_validates_arguments():
     with pytest.raises(ValueError):
-        Configuration.load(filename="config.json", dict_config=dict_config)
+        Configuration.load(filename="config.json", dict_config=_DICT_CONFIG)
 
     with pytest.raises(ValueError):
         Configuration.load(filename=None, dict_config=None)
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 
-from league_history_collector.collectors import selenium_driver
+from league_history_collector.collectors import selenium_driver, selenium_drivers
 
 # test module exports
 # pylint: disable=unused-import
@@ -12,6 +12,7 @@ from league_history_collector.collectors import (
     Configuration,
     ICollector,
     NFLCollector,
+    NFLCollectorPool,
     NFLConfiguration,
 )
 
@@ -27,6 +28,7 @@ def test_selenium_driver_no_kwargs():
         webdriver_mock.Remote.assert_called_once_with(
             command_executor="http://localhost:4444/wd/hub",
             desired_capabilities=DesiredCapabilities.CHROME,
+            keep_alive=True,
         )
         driver_mock.close.assert_called_once()
 
@@ -40,12 +42,16 @@ def test_selenium_driver_with_kwargs():
         desired_capabilities = DesiredCapabilities.FIREFOX
 
         with selenium_driver(
-            command_executor=command_executor, desired_capabilities=desired_capabilities
+            command_executor=command_executor,
+            desired_capabilities=desired_capabilities,
+            keep_alive=False,
         ) as driver:
             assert driver == driver_mock
 
         webdriver_mock.Remote.assert_called_once_with(
-            command_executor=command_executor, desired_capabilities=desired_capabilities
+            command_executor=command_executor,
+            desired_capabilities=desired_capabilities,
+            keep_alive=False,
         )
         driver_mock.close.assert_called_once()
 
@@ -58,3 +64,22 @@ def test_selenium_driver_driver_is_None():
             assert driver is None
 
         # no exception should be thrown by the finally
+
+
+def test_selenium_drivers():
+    with patch("league_history_collector.collectors.webdriver") as webdriver_mock:
+        driver_mocks = [MagicMock(), MagicMock()]
+        webdriver_mock.Remote.side_effect = driver_mocks
+
+        command_executor = "command_executor"
+        with selenium_drivers(2, command_executor=command_executor) as drivers:
+            assert drivers == driver_mocks
+
+        assert webdriver_mock.Remote.call_count == 2
+        webdriver_mock.Remote.assert_called_with(
+            command_executor=command_executor,
+            desired_capabilities=DesiredCapabilities.CHROME,
+            keep_alive=True,
+        )
+        for driver_mock in driver_mocks:
+            driver_mock.close.assert_called_once()
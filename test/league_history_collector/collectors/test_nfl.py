@@ -1,60 +1,98 @@
 # pylint: disable=missing-class-docstring,missing-function-docstring,redefined-outer-name,missing-module-docstring,invalid-name,protected-access
 
+from contextlib import nullcontext
+from itertools import count
 import json
-import tempfile
-from typing import Optional
-from unittest.mock import MagicMock, call, patch
+import os
+import re
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+from unittest.mock import MagicMock, Mock, call, mock_open, patch
 
 import pytest
-
-from league_history_collector.collectors import NFLCollector, NFLConfiguration
+from selenium.common.exceptions import (
+    InvalidCookieDomainException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from league_history_collector.collectors import (
+    NFLCollector,
+    NFLCollectorPool,
+    NFLConfiguration,
+)
 from league_history_collector.collectors.models import League
+from league_history_collector.collectors.nfl import _build_matchup_url
 
 
-def test_NFLConfiguration_load():
-    dict_config = {
-        "username": "nemo",
-        "password": "hunter2",
-        "nfl": {"leagueId": "12345"},
-    }
+_DICT_CONFIG = {
+    "username": "nemo",
+    "password": "hunter2",
+    "nfl": {"leagueId": "12345"},
+}
+_CONFIG = NFLConfiguration.load(dict_config=_DICT_CONFIG)
+_LEAGUE_URL = f"https://fantasy.nfl.com/league/{_CONFIG.league_id}"
+_LOGIN_URL = "https://fantasy.nfl.com/account/sign-in"
+# Where loading `_LOGIN_URL` lands, e.g. after the site adds a query string.
+_LOGIN_FORM_URL = f"{_LOGIN_URL}?redirect=league"
+
+# Stands in for a page-changing action; echoes its arguments so they can be checked.
+_FORMAT_ARGS = "{} {second}".format
+
+
+@pytest.fixture(name="sleep_mock", autouse=True)
+def fixture_sleep_mock(monkeypatch) -> MagicMock:
+    sleep_mock = MagicMock()
+    monkeypatch.setattr("time.sleep", sleep_mock)
+    return sleep_mock
+
+
+@pytest.fixture(name="wait_mock", autouse=True)
+def fixture_wait_mock(monkeypatch) -> MagicMock:
+    wait_mock = MagicMock()
+    monkeypatch.setattr(
+        "league_history_collector.collectors.nfl.WebDriverWait", wait_mock
+    )
+    return wait_mock
 
-    expected_config = NFLConfiguration.load(dict_config=dict_config)
 
-    with tempfile.NamedTemporaryFile("w") as config_file:
-        config_file.write(json.dumps(dict_config))
-        config_file.flush()
+@pytest.fixture(name="time_mock", autouse=True)
+def fixture_time_mock(monkeypatch) -> MagicMock:
+    time_mock = MagicMock(return_value=0)
+    monkeypatch.setattr("time.time", time_mock)
+    return time_mock
 
-        args = {"filename": config_file.name, "dict_config": dict_config}
 
-        for arg, arg_value in args.items():
-            assert NFLConfiguration.load(**{arg: arg_value}) == expected_config
+def test_NFLConfiguration_load():
+    filename = "nfl.json"
+    open_mock = mock_open(read_data=json.dumps(_DICT_CONFIG))
+    with patch("builtins.open", open_mock):
+        assert NFLConfiguration.load(filename=filename) == _CONFIG
 
+    open_mock.assert_called_once_with(filename)
+    assert NFLConfiguration.load(dict_config=_DICT_CONFIG) == _CONFIG
 
-def test_init():
-    dict_config = {
-        "username": "nemo",
-        "password": "hunter2",
-        "nfl": {"leagueId": "12345"},
-    }
-    config = NFLConfiguration.load(dict_config=dict_config)
 
-    driver_mock = MagicMock()
+def test_init(time_mock: MagicMock):
+    driver_mock = Mock(spec=WebDriver)
     time_between_pages_range = (3, 5)
-    wait_seconds_after_page_change = 1
-
-    with patch("time.time") as time_mock:
-        time_mock.return_value = 42
-        collector = NFLCollector(
-            config,
-            driver_mock,
-            time_between_pages_range,
-            wait_seconds_after_page_change,
-        )
+    page_load_timeout = 5
+
+    time_mock.return_value = 42
+    collector = NFLCollector(
+        _CONFIG,
+        driver_mock,
+        time_between_pages_range,
+        page_load_timeout,
+    )
 
-    assert collector._config == config
+    assert collector._config == _CONFIG
     assert collector._driver == driver_mock
     assert collector._time_between_pages_range == time_between_pages_range
-    assert collector._wait_seconds_after_page_change == wait_seconds_after_page_change
+    assert collector._page_load_timeout == page_load_timeout
+    assert collector._loaded_url is None
     assert collector._logged_in is False
 
     time_mock.assert_called_once()
@@ -66,16 +104,8 @@ def test_init():
 
 @pytest.fixture(name="nfl_collector")
 def fixture_nfl_collector():
-    dict_config = {
-        "username": "nemo",
-        "password": "hunter2",
-        "nfl": {"leagueId": "12345"},
-    }
-    config = NFLConfiguration.load(dict_config=dict_config)
-
-    driver_mock = MagicMock()
-
-    collector = NFLCollector(config, driver_mock)
+    # Tests set attributes such as `current_url` on the driver, so each test gets its own.
+    collector = NFLCollector(_CONFIG, Mock(spec=WebDriver))
     yield collector
 
 
@@ -98,248 +128,222 @@ def test_save_all_data(nfl_collector: NFLCollector):
     assert isinstance(nfl_collector.set_season_data.call_args_list[1][0][1], League)
 
 
-def test_change_page_no_sleep(nfl_collector: NFLCollector):
-    def _callable(first, second: Optional[str] = None):
-        return f"{first} {second}"
-
+def test_change_page_no_sleep(
+    nfl_collector: NFLCollector, time_mock: MagicMock, sleep_mock: MagicMock
+):
     nfl_collector._last_page_load_time = 0
-    with patch("time.time") as time_mock:
-        time_mock.side_effect = [
-            nfl_collector._time_between_pages_range[1] + 1,
-            nfl_collector._time_between_pages_range[1] + 2,
-        ]
-
-        with patch("time.sleep") as sleep_mock:
-            assert (
-                nfl_collector._change_page(_callable, "first", second="second")
-                == "first second"
-            )
+    # Each call advances the clock by one second.
+    time_mock.side_effect = count(
+        nfl_collector._time_between_pages_range[1] + 1
+    ).__next__
 
-    time_mock.assert_has_calls([call()] * 2)
-    sleep_mock.assert_has_calls(
-        [call(0), call(nfl_collector._wait_seconds_after_page_change)]
+    assert (
+        nfl_collector._change_page(_FORMAT_ARGS, "first", second="second")
+        == "first second"
     )
 
+    time_mock.assert_has_calls([call()] * 2)
+    assert sleep_mock.call_args_list == [call(0)]
+
     assert (
         nfl_collector._last_page_load_time
         == nfl_collector._time_between_pages_range[1] + 2
     )
 
 
-def test_change_page_with_sleep(nfl_collector: NFLCollector):
-    def _callable(first, second: Optional[str] = None):
-        return f"{first} {second}"
-
+def test_change_page_with_sleep(
+    nfl_collector: NFLCollector, time_mock: MagicMock, sleep_mock: MagicMock
+):
     last_page_load_time = 2
     current_time = 3
     interval = 5
     change_page_time = interval + 1
 
     nfl_collector._last_page_load_time = last_page_load_time
+    time_mock.side_effect = [
+        current_time,
+        change_page_time,
+    ]
+
     with patch("random.uniform") as uniform_mock:
         uniform_mock.return_value = interval
 
-        with patch("time.time") as time_mock:
-            time_mock.side_effect = [
-                current_time,
-                change_page_time,
-            ]
-
-            with patch("time.sleep") as sleep_mock:
-                assert (
-                    nfl_collector._change_page(_callable, "first", second="second")
-                    == "first second"
-                )
+        assert (
+            nfl_collector._change_page(_FORMAT_ARGS, "first", second="second")
+            == "first second"
+        )
 
     uniform_mock.assert_called_once_with(
         nfl_collector._time_between_pages_range[0],
         nfl_collector._time_between_pages_range[1],
     )
     time_mock.assert_has_calls([call()] * 2)
-    sleep_mock.assert_has_calls(
-        [
-            call(interval - (current_time - last_page_load_time)),
-            call(nfl_collector._wait_seconds_after_page_change),
-        ]
-    )
+    assert sleep_mock.call_args_list == [
+        call(interval - (current_time - last_page_load_time)),
+    ]
 
     assert nfl_collector._last_page_load_time == change_page_time
 
 
-def test_login(nfl_collector: NFLCollector):
-    nfl_collector._change_page = MagicMock()
+def _land_on(nfl_collector: NFLCollector, landed_url: Optional[str] = None):
+    """Makes page changes land on `landed_url`, or on the loaded URL if it is None."""
 
-    login_form_mock = MagicMock()
+    def change_page(_action, url):
+        nfl_collector._driver.current_url = landed_url or url  # type: ignore
 
-    username_element_mock = MagicMock()
-    password_element_mock = MagicMock()
+    nfl_collector._change_page = MagicMock(side_effect=change_page)
 
-    fake_button0_mock = MagicMock()
-    fake_button1_mock = MagicMock()
-    real_button_mock = MagicMock()
 
-    nfl_collector._driver.find_element_by_id.return_value = login_form_mock
-    login_form_mock.find_element_by_id.side_effect = [
-        username_element_mock,
-        password_element_mock,
-    ]
+def test_load_page(nfl_collector: NFLCollector, wait_mock: MagicMock):
+    _land_on(nfl_collector)
 
-    def _side_effect_0(arg: str) -> str:
-        if arg == "value":
-            return "not Sign In"
+    nfl_collector._load_page(_LEAGUE_URL, (By.ID, "ready"))
+    nfl_collector._load_page(_LEAGUE_URL, (By.ID, "ready"))
+    nfl_collector._load_page(_LOGIN_URL)
 
-        if arg == "type":
-            return "not submit"
+    assert nfl_collector._change_page.call_args_list == [
+        call(nfl_collector._driver.get, _LEAGUE_URL),
+        call(nfl_collector._driver.get, _LOGIN_URL),
+    ]
+    assert nfl_collector._loaded_url == _LOGIN_URL
 
-        raise ValueError(f"Unexpected argument {arg}")
+    # Only the first load has an element to wait for.
+    wait_mock.assert_called_once_with(
+        nfl_collector._driver, nfl_collector._page_load_timeout
+    )
+    wait_mock.return_value.until.assert_called_once()
 
-    fake_button0_mock.get_attribute.side_effect = _side_effect_0
 
-    def _side_effect_1(arg: str) -> str:
-        if arg == "value":
-            return "Sign In"
+def test_load_page_redirected(nfl_collector: NFLCollector):
+    _land_on(nfl_collector, _LOGIN_FORM_URL)
 
-        if arg == "type":
-            return "not submit"
+    nfl_collector._load_page(_LEAGUE_URL)
+    nfl_collector._load_page(_LEAGUE_URL)
 
-        raise ValueError(f"Unexpected argument {arg}")
+    load_league = call(nfl_collector._driver.get, _LEAGUE_URL)
+    assert nfl_collector._change_page.call_args_list == [load_league, load_league]
+    assert nfl_collector._loaded_url is None
 
-    fake_button1_mock.get_attribute.side_effect = _side_effect_1
 
-    def _side_effect_2(arg: str) -> str:
-        if arg == "value":
-            return "Sign In"
+def test_load_page_not_ready(nfl_collector: NFLCollector, wait_mock: MagicMock):
+    _land_on(nfl_collector)
+    wait_mock.return_value.until.side_effect = [TimeoutException(), None]
 
-        if arg == "type":
-            return "submit"
+    with pytest.raises(TimeoutException):
+        nfl_collector._load_page(_LEAGUE_URL, (By.ID, "ready"))
+    assert nfl_collector._loaded_url is None
 
-        raise ValueError(f"Unexpected argument {arg}")
+    nfl_collector._load_page(_LEAGUE_URL, (By.ID, "ready"))
 
-    real_button_mock.get_attribute.side_effect = _side_effect_2
+    load_league = call(nfl_collector._driver.get, _LEAGUE_URL)
+    assert nfl_collector._change_page.call_args_list == [load_league, load_league]
+    assert nfl_collector._loaded_url == _LEAGUE_URL
 
-    nfl_collector._driver.find_elements_by_class_name.return_value = [
-        fake_button0_mock,
-        fake_button1_mock,
-        real_button_mock,
-        fake_button1_mock,
-    ]
 
-    nfl_collector._driver.current_url = (  # type: ignore
-        f"https://fantasy.nfl.com/league/{nfl_collector._config.league_id}"
-    )
+def test_change_page_forgets_loaded_url(nfl_collector: NFLCollector):
+    nfl_collector._loaded_url = _LEAGUE_URL
 
-    with patch("time.sleep") as sleep_mock:
-        nfl_collector._login()
+    nfl_collector._change_page(_FORMAT_ARGS, "first", second="second")
 
-    expected_login_url = "https://fantasy.nfl.com/account/sign-in"
-
-    nfl_collector._change_page.assert_has_calls(
-        [
-            call(
-                nfl_collector._driver.get,
-                expected_login_url,
-            ),
-            call(
-                nfl_collector._driver.get,
-                f"https://fantasy.nfl.com/league/{nfl_collector._config.league_id}",
-            ),
-        ],
-        any_order=True,
-    )
-    nfl_collector._driver.find_element_by_id.assert_any_call("gigya-login-form")
-    login_form_mock.find_element_by_id.assert_has_calls(
-        [
-            call("gigya-loginID-60062076330815260"),
-            call("gigya-password-85118380969228590"),
-        ]
-    )
+    assert nfl_collector._loaded_url is None
 
-    username_element_mock.send_keys.assert_called_once_with(
-        nfl_collector._config.username
-    )
-    password_element_mock.send_keys.assert_called_once_with(
-        nfl_collector._config.password
-    )
 
-    nfl_collector._driver.find_elements_by_class_name.assert_called_once_with(
-        "gigya-input-submit"
-    )
-    fake_button1_mock.get_attribute.assert_has_calls([call("value"), call("type")])
-    real_button_mock.get_attribute.assert_has_calls([call("value"), call("type")])
-
-    nfl_collector._change_page.assert_any_call(real_button_mock.click)
-
-    sleep_mock.assert_called_once_with(
-        3 - nfl_collector._wait_seconds_after_page_change
-    )
+def _make_button(value: str, type_: str) -> Mock:
+    button = Mock(spec=WebElement)
+    button.get_attribute.side_effect = {"value": value, "type": type_}.__getitem__
+    return button
 
 
-def test_login_no_login_button(nfl_collector: NFLCollector):
-    nfl_collector._change_page = MagicMock()
+_LOGIN_BUTTON_ATTRIBUTES = ("Sign In", "submit")
+_CALL_LOGIN_ID = call("gigya-loginID-60062076330815260")
+_CALL_PASSWORD = call("gigya-password-85118380969228590")
+_CALLS_VALUE_TYPE = [call("value"), call("type")]
 
-    login_form_mock = MagicMock()
 
-    username_element_mock = MagicMock()
-    password_element_mock = MagicMock()
+def _login_page_changer(nfl_collector: NFLCollector, current_url: str):
+    def change_page(*args):
+        # Loading the sign-in page lands on the form; every later page change, including
+        # submitting the form, ends up on `current_url`.
+        nfl_collector._driver.current_url = (  # type: ignore
+            _LOGIN_FORM_URL if args[1:] == (_LOGIN_URL,) else current_url
+        )
 
-    fake_button0_mock = MagicMock()
-    fake_button1_mock = MagicMock()
+    return change_page
+
+
+def _raises_login_error(expected_error: Optional[str]):
+    if expected_error is None:
+        return nullcontext()
+
+    return pytest.raises(RuntimeError, match=re.escape(expected_error))
+
+
+@pytest.mark.parametrize(
+    "button_attributes,current_url,expected_error",
+    [
+        (
+            [
+                ("not Sign In", "not submit"),
+                ("Sign In", "not submit"),
+                _LOGIN_BUTTON_ATTRIBUTES,
+                ("Sign In", "not submit"),
+            ],
+            _LEAGUE_URL,
+            None,
+        ),
+        (
+            [("not Sign In", "not submit"), ("Sign In", "not submit")],
+            _LEAGUE_URL,
+            "Could not find login button",
+        ),
+        (
+            [
+                ("not Sign In", "not submit"),
+                ("Sign In", "not submit"),
+                _LOGIN_BUTTON_ATTRIBUTES,
+                ("Sign In", "not submit"),
+            ],
+            f"not {_LEAGUE_URL}",
+            f"Expected to be on page {_LEAGUE_URL}, but on not {_LEAGUE_URL} instead",
+        ),
+    ],
+    ids=["success", "no_login_button", "unmatched_url"],
+)
+def test_login(
+    nfl_collector: NFLCollector,
+    button_attributes: List[Tuple[str, str]],
+    current_url: str,
+    expected_error: Optional[str],
+):
+    nfl_collector._change_page = MagicMock(
+        side_effect=_login_page_changer(nfl_collector, current_url)
+    )
+
+    login_form_mock = Mock(spec=WebElement)
+
+    username_element_mock = Mock(spec=WebElement)
+    password_element_mock = Mock(spec=WebElement)
+
+    buttons = [_make_button(value, type_) for value, type_ in button_attributes]
 
     nfl_collector._driver.find_element_by_id.return_value = login_form_mock
     login_form_mock.find_element_by_id.side_effect = [
         username_element_mock,
         password_element_mock,
     ]
+    nfl_collector._driver.find_elements_by_class_name.return_value = buttons
 
-    def _side_effect_0(arg: str) -> str:
-        if arg == "value":
-            return "not Sign In"
-
-        if arg == "type":
-            return "not submit"
-
-        raise ValueError(f"Unexpected argument {arg}")
-
-    fake_button0_mock.get_attribute.side_effect = _side_effect_0
-
-    def _side_effect_1(arg: str) -> str:
-        if arg == "value":
-            return "Sign In"
-
-        if arg == "type":
-            return "not submit"
-
-        raise ValueError(f"Unexpected argument {arg}")
-
-    fake_button1_mock.get_attribute.side_effect = _side_effect_1
-
-    nfl_collector._driver.find_elements_by_class_name.return_value = [
-        fake_button0_mock,
-        fake_button1_mock,
-    ]
-
-    nfl_collector._driver.current_url = (  # type: ignore
-        f"https://fantasy.nfl.com/league/{nfl_collector._config.league_id}"
-    )
-
-    with pytest.raises(RuntimeError) as exception_raised:
+    with _raises_login_error(expected_error):
         nfl_collector._login()
-        assert f"{exception_raised.value}" == "Could not find login button"
-
-    expected_login_url = "https://fantasy.nfl.com/account/sign-in"
 
-    nfl_collector._change_page.assert_any_call(
-        nfl_collector._driver.get,
-        expected_login_url,
-    )
+    assert nfl_collector._logged_in is (expected_error is None)
 
+    nfl_collector._change_page.assert_any_call(nfl_collector._driver.get, _LOGIN_URL)
     nfl_collector._driver.find_element_by_id.assert_any_call("gigya-login-form")
-    login_form_mock.find_element_by_id.assert_has_calls(
-        [
-            call("gigya-loginID-60062076330815260"),
-            call("gigya-password-85118380969228590"),
-        ]
-    )
+    assert login_form_mock.find_element_by_id.call_args_list == [
+        _CALL_LOGIN_ID,
+        _CALL_PASSWORD,
+    ]
 
     username_element_mock.send_keys.assert_called_once_with(
         nfl_collector._config.username
@@ -351,139 +355,166 @@ def test_login_no_login_button(nfl_collector: NFLCollector):
     nfl_collector._driver.find_elements_by_class_name.assert_called_once_with(
         "gigya-input-submit"
     )
-    fake_button1_mock.get_attribute.assert_has_calls([call("value"), call("type")])
 
+    # Buttons are checked in order until the login button is found.
+    num_checked = len(buttons)
+    if _LOGIN_BUTTON_ATTRIBUTES in button_attributes:
+        num_checked = button_attributes.index(_LOGIN_BUTTON_ATTRIBUTES) + 1
+
+    for button in buttons[:num_checked]:
+        assert button.get_attribute.call_args_list == _CALLS_VALUE_TYPE
+    for button in buttons[num_checked:]:
+        button.get_attribute.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "current_url,expected_error",
+    [
+        (_LEAGUE_URL, None),
+        (
+            f"not {_LEAGUE_URL}",
+            f"Expected to be on page {_LEAGUE_URL}, but on not {_LEAGUE_URL} instead",
+        ),
+    ],
+    ids=["success", "unmatched_url"],
+)
+def test_login_after_submit(
+    nfl_collector: NFLCollector,
+    wait_mock: MagicMock,
+    current_url: str,
+    expected_error: Optional[str],
+):
+    nfl_collector._change_page = MagicMock(
+        side_effect=_login_page_changer(nfl_collector, current_url)
+    )
+
+    login_button = _make_button(*_LOGIN_BUTTON_ATTRIBUTES)
+    nfl_collector._driver.find_elements_by_class_name.return_value = [login_button]
+
+    with _raises_login_error(expected_error):
+        nfl_collector._login()
 
-def test_login_unmatched_url(nfl_collector: NFLCollector):
-    nfl_collector._change_page = MagicMock()
+    nfl_collector._change_page.assert_any_call(login_button.click)
+    nfl_collector._change_page.assert_any_call(nfl_collector._driver.get, _LEAGUE_URL)
 
-    login_form_mock = MagicMock()
+    # The first wait is for the login form to load, and the second is for the redirect
+    # away from the URL the form was submitted from.
+    until_mock = wait_mock.return_value.until
+    assert until_mock.call_count == 2
+    redirected = until_mock.call_args_list[1][0][0]
+    assert redirected(SimpleNamespace(current_url=_LEAGUE_URL))
+    assert not redirected(SimpleNamespace(current_url=_LOGIN_FORM_URL))
 
-    username_element_mock = MagicMock()
-    password_element_mock = MagicMock()
 
-    fake_button0_mock = MagicMock()
-    fake_button1_mock = MagicMock()
-    real_button_mock = MagicMock()
+def test_login_with_cookies_file(nfl_collector: NFLCollector, tmp_path):
+    cookies = [{"name": "session", "value": "abc", "domain": ".nfl.com"}]
+    cookies_file = tmp_path / "cookies.json"
+    cookies_file.write_text(json.dumps(cookies))
 
-    nfl_collector._driver.find_element_by_id.return_value = login_form_mock
-    login_form_mock.find_element_by_id.side_effect = [
-        username_element_mock,
-        password_element_mock,
-    ]
+    nfl_collector._change_page = MagicMock()
+    nfl_collector._driver.current_url = _LEAGUE_URL  # type: ignore
+
+    nfl_collector.login(str(cookies_file))
+
+    assert nfl_collector._logged_in is True
+    nfl_collector._driver.add_cookie.assert_called_once_with(cookies[0])
+    nfl_collector._driver.find_element_by_id.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "cached_text",
+    [
+        None,
+        json.dumps([{"name": "session", "value": "expired", "domain": ".nfl.com"}]),
+        '[{"name": "session", "val',
+    ],
+    ids=["no_cache", "stale_cache", "corrupt_cache"],
+)
+def test_login_saves_cookies(
+    nfl_collector: NFLCollector, tmp_path, cached_text: Optional[str]
+):
+    cookies_file = tmp_path / "cookies.json"
+    if cached_text is not None:
+        cookies_file.write_text(cached_text)
 
-    def _side_effect_0(arg: str) -> str:
-        if arg == "value":
-            return "not Sign In"
+    nfl_collector._change_page = MagicMock()
+    nfl_collector._login = MagicMock()
+    nfl_collector._driver.current_url = _LOGIN_URL  # type: ignore
+    cookies = [{"name": "session", "value": "abc", "domain": ".nfl.com"}]
+    nfl_collector._driver.get_cookies.return_value = cookies
 
-        if arg == "type":
-            return "not submit"
+    nfl_collector.login(str(cookies_file))
 
-        raise ValueError(f"Unexpected argument {arg}")
+    nfl_collector._login.assert_called_once()
+    assert json.loads(cookies_file.read_text()) == cookies
+    assert os.stat(cookies_file).st_mode & 0o777 == 0o600
 
-    fake_button0_mock.get_attribute.side_effect = _side_effect_0
 
-    def _side_effect_1(arg: str) -> str:
-        if arg == "value":
-            return "Sign In"
+def test_login_without_cookies_file(nfl_collector: NFLCollector):
+    nfl_collector._login = MagicMock()
 
-        if arg == "type":
-            return "not submit"
+    nfl_collector.login()
+    nfl_collector._login.assert_called_once()
 
-        raise ValueError(f"Unexpected argument {arg}")
+    nfl_collector._logged_in = True
+    nfl_collector.login()
+    nfl_collector._login.assert_called_once()
+    nfl_collector._driver.get_cookies.assert_not_called()
 
-    fake_button1_mock.get_attribute.side_effect = _side_effect_1
 
-    def _side_effect_2(arg: str) -> str:
-        if arg == "value":
-            return "Sign In"
+def test_get_session_cookies(nfl_collector: NFLCollector):
+    nfl_collector._login = MagicMock()
+    cookies = [{"name": "session", "value": "abc", "domain": ".nfl.com"}]
+    nfl_collector._driver.get_cookies.return_value = cookies
 
-        if arg == "type":
-            return "submit"
+    assert nfl_collector.get_session_cookies() == cookies
+    nfl_collector._login.assert_called_once()
 
-        raise ValueError(f"Unexpected argument {arg}")
+    nfl_collector._logged_in = True
+    assert nfl_collector.get_session_cookies() == cookies
+    nfl_collector._login.assert_called_once()
 
-    real_button_mock.get_attribute.side_effect = _side_effect_2
 
-    nfl_collector._driver.find_elements_by_class_name.return_value = [
-        fake_button0_mock,
-        fake_button1_mock,
-        real_button_mock,
-        fake_button1_mock,
+def test_set_session_cookies(nfl_collector: NFLCollector):
+    nfl_collector._change_page = MagicMock()
+    nfl_collector._driver.current_url = _LEAGUE_URL  # type: ignore
+    nfl_collector._driver.add_cookie.side_effect = [
+        None,
+        InvalidCookieDomainException(),
+        InvalidCookieDomainException(),
+    ]
+    cookies = [
+        {"name": "session", "value": "abc", "domain": ".nfl.com"},
+        {"name": "other", "value": "def", "domain": ".example.com"},
+        {"value": "unnamed", "domain": ".example.com"},
     ]
 
-    nfl_collector._driver.current_url = (  # type: ignore
-        f"not https://fantasy.nfl.com/league/{nfl_collector._config.league_id}"
-    )
-    expected_url = f"https://fantasy.nfl.com/league/{nfl_collector._config.league_id}"
-
-    with patch("time.sleep") as sleep_mock:
-        with pytest.raises(RuntimeError) as exception_raised:
-            nfl_collector._login()
-            assert (
-                f"{exception_raised}"
-                == f"Expected to be on page {expected_url}, but on"
-                f"{nfl_collector._driver.current_url} instead"
-            )
-
-    expected_login_url = "https://fantasy.nfl.com/account/sign-in"
-
-    nfl_collector._change_page.assert_has_calls(
-        [
-            call(
-                nfl_collector._driver.get,
-                expected_login_url,
-            ),
-            call(
-                nfl_collector._driver.get,
-                f"https://fantasy.nfl.com/league/{nfl_collector._config.league_id}",
-            ),
-        ],
-        any_order=True,
-    )
+    nfl_collector.set_session_cookies(cookies)
 
-    nfl_collector._driver.find_element_by_id.assert_any_call("gigya-login-form")
-    login_form_mock.find_element_by_id.assert_has_calls(
-        [
-            call("gigya-loginID-60062076330815260"),
-            call("gigya-password-85118380969228590"),
-        ]
-    )
+    assert nfl_collector._logged_in is True
+    assert nfl_collector._driver.add_cookie.call_args_list == [
+        call(cookie) for cookie in cookies
+    ]
+    assert nfl_collector._change_page.call_args_list == [
+        call(nfl_collector._driver.get, "https://fantasy.nfl.com"),
+        call(nfl_collector._driver.get, _LEAGUE_URL),
+    ]
 
-    username_element_mock.send_keys.assert_called_once_with(
-        nfl_collector._config.username
-    )
-    password_element_mock.send_keys.assert_called_once_with(
-        nfl_collector._config.password
-    )
 
-    nfl_collector._driver.find_elements_by_class_name.assert_called_once_with(
-        "gigya-input-submit"
-    )
-    fake_button1_mock.get_attribute.assert_has_calls([call("value"), call("type")])
-    real_button_mock.get_attribute.assert_has_calls([call("value"), call("type")])
+def test_set_session_cookies_not_logged_in(nfl_collector: NFLCollector):
+    nfl_collector._change_page = MagicMock()
+    nfl_collector._driver.current_url = _LOGIN_URL  # type: ignore
 
-    nfl_collector._change_page.assert_any_call(real_button_mock.click)
+    with pytest.raises(RuntimeError, match="Expected to be on page"):
+        nfl_collector.set_session_cookies([])
 
-    sleep_mock.assert_called_once_with(
-        3 - nfl_collector._wait_seconds_after_page_change
-    )
+    assert nfl_collector._logged_in is False
 
 
 def test_get_seasons(nfl_collector: NFLCollector):
     nfl_collector._login = MagicMock()
-    nav_mock = MagicMock()
-    dropdown_mock = MagicMock()
-    season0_mock = MagicMock()
-    season1_mock = MagicMock()
-
     nfl_collector._change_page = MagicMock()
-    nfl_collector._driver.find_element_by_id.return_value = nav_mock
-    nav_mock.find_element_by_class_name.return_value = dropdown_mock
-    dropdown_mock.find_elements_by_xpath.return_value = [season0_mock, season1_mock]
-
-    season0_mock.get_attribute.return_value = "2019 Season"
-    season1_mock.get_attribute.return_value = "2018 Season"
+    nfl_collector._driver.execute_script.return_value = ["2019 Season", "2018 Season"]
 
     assert nfl_collector.get_seasons() == [2019, 2018]
 
@@ -491,14 +522,16 @@ def test_get_seasons(nfl_collector: NFLCollector):
 
     nfl_collector._change_page.assert_called_once_with(
         nfl_collector._driver.get,
-        f"https://fantasy.nfl.com/league/{nfl_collector._config.league_id}/history",
+        f"{_LEAGUE_URL}/history",
     )
-    nfl_collector._driver.find_element_by_id.assert_called_once_with("historySeasonNav")
-    nav_mock.find_element_by_class_name.assert_called_once_with("st-menu")
-    dropdown_mock.find_elements_by_xpath.assert_called_once_with(".//a")
-
-    season0_mock.get_attribute.assert_called_once_with("textContent")
-    season1_mock.get_attribute.assert_called_once_with("textContent")
+    nfl_collector._driver.execute_script.assert_called_once()
+    # Only links in the first menu of the season nav are read.
+    script = nfl_collector._driver.execute_script.call_args[0][0]
+    assert (
+        "document.querySelector('#historySeasonNav .st-menu').querySelectorAll('a')"
+        in script
+    )
+    assert "textContent" in script
 
 
 def test_get_final_standings_url(nfl_collector: NFLCollector):
@@ -571,10 +604,18 @@ def test_get_matchup_url_full_box_score(nfl_collector: NFLCollector):
     )
 
 
+def test_build_matchup_url_is_cached():
+    league_id = _CONFIG.league_id
+    url = _build_matchup_url(league_id, 2018, 3, "2")
+
+    assert _build_matchup_url(league_id, 2018, 3, "2") is url
+    assert _build_matchup_url(league_id, 2018, 3, "2", True) is not url
+
+
 def test_get_team_id_from_link():
     team_id = "2"
 
-    web_element_mock = MagicMock()
+    web_element_mock = Mock(spec=WebElement)
     web_element_mock.get_attribute.return_value = (
         f"/url/to/something?query=param&teamId={team_id}"
     )
@@ -587,7 +628,7 @@ def test_get_team_id_from_link():
 def test_get_team_id_from_link_invalid():
     team_id = "2"
 
-    web_element_mock = MagicMock()
+    web_element_mock = Mock(spec=WebElement)
     web_element_mock.get_attribute.return_value = (
         f"/url/to/something?teamId={team_id}&query=param"
     )
@@ -601,7 +642,7 @@ def test_get_team_id_from_link_invalid():
 def test_get_team_id_from_class():
     team_id = "2"
 
-    web_element_mock = MagicMock()
+    web_element_mock = Mock(spec=WebElement)
     web_element_mock.get_attribute.return_value = f"teamTotal teamId-{team_id}"
 
     assert team_id == NFLCollector._get_team_id_from_class(web_element_mock)
@@ -612,7 +653,7 @@ def test_get_team_id_from_class():
 def test_get_team_id_from_class_invalid():
     team_id = "2"
 
-    web_element_mock = MagicMock()
+    web_element_mock = Mock(spec=WebElement)
     web_element_mock.get_attribute.return_value = f"teamTotal teamId-{team_id}-"
 
     with pytest.raises(RuntimeError):
@@ -624,7 +665,7 @@ def test_get_team_id_from_class_invalid():
 def test_get_player_id_from_class():
     player_id = "100"
 
-    web_element_mock = MagicMock()
+    web_element_mock = Mock(spec=WebElement)
     web_element_mock.get_attribute.return_value = (
         f"playerNameId-{player_id} somethingElse"
     )
@@ -637,7 +678,7 @@ def test_get_player_id_from_class():
 def test_get_player_id_from_class_invalid():
     player_id = "100"
 
-    web_element_mock = MagicMock()
+    web_element_mock = Mock(spec=WebElement)
     web_element_mock.get_attribute.return_value = (
         f"playerNameId-{player_id}a somethingElse"
     )
@@ -646,3 +687,40 @@ def test_get_player_id_from_class_invalid():
         NFLCollector._get_player_id_from_class(web_element_mock)
 
     web_element_mock.get_attribute.assert_called_once_with("class")
+
+
+def test_NFLCollectorPool():
+    collectors = [Mock(spec=NFLCollector) for _ in range(3)]
+    cookies = [{"name": "session", "value": "abc", "domain": ".nfl.com"}]
+    collectors[0].get_session_cookies.return_value = cookies
+
+    pool = NFLCollectorPool(collectors, "cookies.json")
+
+    collectors[0].login.assert_called_once_with("cookies.json")
+    collectors[0].set_session_cookies.assert_not_called()
+    for collector in collectors[1:]:
+        collector.login.assert_not_called()
+        collector.set_session_cookies.assert_called_once_with(cookies)
+
+    # Collectors are lent out in turn, and a borrowed one is not lent out again.
+    with pool.borrow() as first, pool.borrow() as second:
+        assert (first, second) == (collectors[0], collectors[1])
+    with pool.borrow() as third:
+        assert third is collectors[2]
+
+
+def test_NFLCollectorPool_map():
+    collectors = [Mock(spec=NFLCollector) for _ in range(2)]
+    pool = NFLCollectorPool(collectors)
+
+    used = set()
+
+    def _collect(collector: NFLCollector, year: int) -> int:
+        used.add(collector)
+        return year * 2
+
+    assert list(pool.map(_collect, [2019, 2020, 2021])) == [4038, 4040, 4042]
+    assert used <= set(collectors)
+
+    with pool.borrow() as first, pool.borrow() as second:
+        assert {first, second} == set(collectors)
@@ -1,15 +1,53 @@
 # pylint: disable=missing-class-docstring,missing-function-docstring,redefined-outer-name,missing-module-docstring,invalid-name
 
+import argparse
+import json
+
 from dataclasses_json.api import LetterCase
 from dataclasses_json.cfg import config as dataclasses_json_config
+import pytest
 from stringcase import camelcase
 
-from league_history_collector.utils import CamelCasedDataclass
+from league_history_collector.utils import (
+    CamelCasedDataclass,
+    dump_json,
+    positive_int,
+)
+
+
+_EXPECTED_CONFIG = dataclasses_json_config(letter_case=camelcase)["dataclasses_json"]
 
 
 def test_CamelCasedDataclass():
     assert camelcase is LetterCase.CAMEL
-    assert (
-        CamelCasedDataclass.dataclass_json_config
-        == dataclasses_json_config(letter_case=camelcase)["dataclasses_json"]
-    )
+    assert CamelCasedDataclass.dataclass_json_config == _EXPECTED_CONFIG
+
+
+def test_dump_json():
+    data = {"b": {2019: 1.5, 2018: None}, "a": [1, "two"]}
+
+    assert dump_json(data) == b'{"a":[1,"two"],"b":{"2018":null,"2019":1.5}}'
+    assert dump_json(data, pretty=True) == json.dumps(
+        data, sort_keys=True, indent=2
+    ).encode("utf-8")
+
+
+def test_dump_json_sorts_int_keys_numerically():
+    data = {"weeks": {10: "c", 2: "b", 1: "a"}, "playoffs": [{10: True, 9: False}]}
+
+    assert dump_json(data) == json.dumps(
+        data, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+    assert dump_json(data).startswith(b'{"playoffs":[{"9":false,"10":true}]')
+    assert dump_json(data).endswith(b'"weeks":{"1":"a","2":"b","10":"c"}}')
+
+
+def test_positive_int():
+    assert positive_int("3") == 3
+
+    for value in ["0", "-1"]:
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_int(value)
+
+    with pytest.raises(ValueError):
+        positive_int("one")
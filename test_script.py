@@ -2,44 +2,90 @@
 
 """Script for testing functionality."""
 
-import json
+import argparse
 import sys
+from typing import Dict, List, Set
 
 from loguru import logger
 
 from league_history_collector.collectors import (
     NFLCollector,
+    NFLCollectorPool,
     NFLConfiguration,
     selenium_driver,
+    selenium_drivers,
 )
 from league_history_collector.collectors.models import League
+from league_history_collector.utils import dump_json, positive_int
 
 
-FLAGS = {
-    "SET_SEASON_DATA": False,
-    "GET_SEASONS": False,
-    "GET_WEEKS": False,
-    "GET_GAME_RESULTS": True,
-    "GET_WEEK_RESULTS": False,
-}
+FLAGS = [
+    "SET_SEASON_DATA",
+    "GET_SEASONS",
+    "GET_WEEKS",
+    "GET_GAME_RESULTS",
+    "GET_WEEK_RESULTS",
+]
+
+
+def parse_flags() -> argparse.Namespace:
+    """Parses which functionality to test from the command line. All requested checks
+    share one driver and login, except GET_WEEKS, which starts extra drivers (up to
+    `--drivers` in total) to check seasons in parallel. If no checks are requested,
+    GET_GAME_RESULTS is run."""
+
+    parser = argparse.ArgumentParser("Tests NFL collector functionality")
+    parser.add_argument(
+        "-c", "--config", help="Path to configuration file", default="config.json"
+    )
+    parser.add_argument(
+        "-d",
+        "--drivers",
+        help="Number of browser sessions used to get weeks of seasons in parallel",
+        type=positive_int,
+        default=1,
+    )
+    for flag in FLAGS:
+        parser.add_argument(
+            f"--{flag.lower().replace('_', '-')}",
+            dest=flag,
+            action="store_true",
+            default=False,
+        )
+
+    flags = parser.parse_args()
+    if not any(getattr(flags, flag) for flag in FLAGS):
+        flags.GET_GAME_RESULTS = True
+
+    return flags
+
+
+def get_weeks_by_season(collectors: List[NFLCollector]) -> Dict[int, Set[int]]:
+    """Gets the weeks of every season, checking seasons in parallel with one thread per
+    collector. The others reuse the first collector's session."""
+
+    pool = NFLCollectorPool(collectors)
+    with pool.borrow() as seasons_collector:
+        league_seasons = seasons_collector.get_seasons()
+
+    return dict(zip(league_seasons, pool.map(NFLCollector._get_weeks, league_seasons)))
 
 
 if __name__ == "__main__":
     logger.remove(0)
     logger.add(sys.stderr, level="DEBUG")
 
-    if FLAGS["SET_SEASON_DATA"] is True:
-        for flag, value in FLAGS.items():
-            if flag == "SET_SEASON_DATA":
-                continue
+    args = parse_flags()
 
-            input(
-                "SET_SEASON_DATA and at least one other flag are both True."
-                "This may result in a longer than necessary test. Continue [Press ENTER]?"
-            )
-            break
+    if args.SET_SEASON_DATA and any(
+        getattr(args, flag) for flag in FLAGS if flag != "SET_SEASON_DATA"
+    ):
+        input(
+            "SET_SEASON_DATA and at least one other flag are both True. "
+            "This may result in a longer than necessary test. Continue [Press ENTER]?"
+        )
 
-    config = NFLConfiguration.load(filename="config.json")
+    config = NFLConfiguration.load(filename=args.config)
 
     with selenium_driver() as driver:
         collector = NFLCollector(config, driver, (0, 1))
@@ -49,28 +95,35 @@ if __name__ == "__main__":
         team_to_manager, managers = collector._get_managers(2019)
         logger.info(f"Managers in 2019: {managers}")
 
-        if FLAGS["GET_SEASONS"]:
+        if args.GET_SEASONS:
             seasons = collector.get_seasons()
             logger.info(
                 f"The following seasons are present in league history: {seasons}"
             )
 
-        if FLAGS["GET_WEEKS"]:
-            weeks = collector._get_weeks(2019)
-            logger.info(f"The following weeks are present in 2019: {weeks}")
+        if args.GET_WEEKS:
+            # Only this check uses more than one driver, so only start the others here.
+            with selenium_drivers(args.drivers - 1) as other_drivers:
+                weeks_by_season = get_weeks_by_season(
+                    [collector]
+                    + [NFLCollector(config, other, (0, 1)) for other in other_drivers]
+                )
+
+            for year, weeks in weeks_by_season.items():
+                logger.info(f"The following weeks are present in {year}: {weeks}")
 
-        if FLAGS["SET_SEASON_DATA"]:
+        if args.SET_SEASON_DATA:
             league = League(id=config.league_id, managers={}, seasons={})
             collector.set_season_data(2019, league)
 
-            logger.info(json.dumps(league.to_dict(), sort_keys=True, indent=4))
+            logger.info(dump_json(league.to_dict(), pretty=True).decode("utf-8"))
 
-        if FLAGS["GET_GAME_RESULTS"]:
+        if args.GET_GAME_RESULTS:
             game_results = collector._get_game_results(
                 2019, 1, team_to_manager, ("2", "4")
             )
             logger.info(f"2019 Week 1:\n{game_results.to_json()}")
 
-        if FLAGS["GET_WEEK_RESULTS"]:
+        if args.GET_WEEK_RESULTS:
             week_results = collector._get_games_for_week(2019, 1, team_to_manager)
             logger.info(f"2019 Week 1:\n{week_results.to_json()}")